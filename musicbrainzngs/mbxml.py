@@ -3,7 +3,9 @@
 # This file is distributed under a BSD-2-Clause type license.
 # See the COPYING file for more information.
 
+import functools
 import re
+import sys
 import xml.etree.ElementTree as ET
 import logging
 
@@ -33,6 +35,27 @@ NS_MAP = {"http://musicbrainz.org/ns/mmd-2.0#": "ws2",
           "http://musicbrainz.org/ns/ext#-2.0": "ext"}
 _log = logging.getLogger("musicbrainzngs")
 
+# Responses only use a small set of tag and attribute names, so the
+# results of resolving them are cached. They are also interned, so all
+# parsed results share the same key objects.
+
+@functools.lru_cache(maxsize=512)
+def _fixtag(tag):
+    """Return `tag` with its namespace replaced by the prefix in NS_MAP."""
+    return sys.intern(fixtag(tag, NS_MAP)[0])
+
+@functools.lru_cache(maxsize=512)
+def _local_name(tag):
+    """Return `tag` without its namespace."""
+    return sys.intern(_fixtag(tag).split(":")[-1])
+
+@functools.lru_cache(maxsize=512)
+def _count_key(name):
+    """Return the result key for the count of the list element `name`,
+    or None if it isn't a list."""
+    m = re.match(r'([a-z0-9-]+)-list', name)
+    return sys.intern(f"{m[1]}-count") if m else None
+
 def get_error_message(error):
     """ Given an error XML message from the webservice containing
     <error><text>x</text><text>y</text></error>, return a list
@@ -44,7 +67,7 @@ def get_error_message(error):
         if root.tag == "error":
             errors.extend(ch.text for ch in root if ch.tag == "text")
         return errors
-    except ET.ParseError:
+    except util.PARSE_ERRORS:
         return None
 
 def make_artist_credit(artists):
@@ -86,9 +109,7 @@ def parse_elements(valid_els, inner_els, element):
     """
     result = {}
     for sub in element:
-        t = fixtag(sub.tag, NS_MAP)[0]
-        if ":" in t:
-            t = t.split(":")[1]
+        t = _local_name(sub.tag)
         if t in valid_els:
             result[t] = sub.text or ""
         elif t in inner_els.keys():
@@ -98,12 +119,12 @@ def parse_elements(valid_els, inner_els, element):
             else:
                 result[t] = inner_result
             # add counts for lists when available
-            m = re.match(r'([a-z0-9-]+)-list', t)
-            if m and "count" in sub.attrib:
-                result[f"{m[1]}-count"] = int(sub.attrib["count"])
+            count_key = _count_key(t)
+            if count_key and "count" in sub.attrib:
+                result[count_key] = int(sub.attrib["count"])
         else:
             _log.info("in <%s>, uncaught <%s>",
-                      fixtag(element.tag, NS_MAP)[0], t)
+                      _fixtag(element.tag), t)
     return result
 
 def parse_attributes(attributes, element):
@@ -116,19 +137,21 @@ def parse_attributes(attributes, element):
     result = {}
     for attr in element.attrib:
         if "{" in attr:
-            a = fixtag(attr, NS_MAP)[0]
+            a = _fixtag(attr)
         else:
             a = attr
         if a in attributes:
             result[a] = element.attrib[attr]
         else:
-            _log.info("in <%s>, uncaught attribute %s", fixtag(element.tag, NS_MAP)[0], attr)
+            _log.info("in <%s>, uncaught attribute %s", _fixtag(element.tag), attr)
 
     return result
 
 def parse_message(message):
-    tree = util.bytes_to_elementtree(message)
-    root = tree.getroot()
+    """Parse a response from the webservice into a dict. `message` may be
+    a byte string, a file-like object or an iterable of byte strings.
+    The latter two are parsed incrementally.
+    """
     result = {}
     valid_elements = {"area": parse_area,
                       "artist": parse_artist,
@@ -166,7 +189,61 @@ def parse_message(message):
 
                       "message": parse_response_message
                       }
-    result |= parse_elements([], valid_elements, root)
+    if isinstance(message, (str, bytes)):
+        root = util.bytes_to_elementtree(message).getroot()
+        result |= parse_elements([], valid_elements, root)
+        return result
+
+    if hasattr(message, "read"):
+        message = iter(functools.partial(message.read, 65536), b"")
+    item_parsers = {"annotation-list": parse_annotation,
+                    "area-list": parse_area,
+                    "artist-list": parse_artist,
+                    "label-list": parse_label,
+                    "place-list": parse_place,
+                    "event-list": parse_event,
+                    "instrument-list": parse_instrument,
+                    "release-list": parse_release,
+                    "release-group-list": parse_release_group,
+                    "series-list": parse_series,
+                    "recording-list": parse_recording,
+                    "work-list": parse_work,
+                    "url-list": parse_url,
+                    "collection-list": parse_collection}
+    result |= _parse_message_stream(message, valid_elements, item_parsers)
+    return result
+
+def _parse_message_stream(chunks, valid_elements, item_parsers):
+    """Parse a message while it is being read. The items of top-level
+    lists are parsed as soon as they are complete and then dropped from
+    the tree, so only one of them is held in memory at a time.
+    """
+    root = None
+    depth = 0
+    parser = None
+    items = {}
+    for event, elem in util.iterparse(chunks):
+        if event == "start":
+            depth += 1
+            if depth == 1:
+                root = elem
+            elif depth == 2:
+                parent = elem
+                tag = _local_name(elem.tag)
+                parser = item_parsers.get(tag)
+                if parser is not None:
+                    parsed = items[tag] = []
+            continue
+        depth -= 1
+        if depth == 2 and parser is not None:
+            parsed.append(parser(elem))
+            parent.remove(elem)
+
+    # The streamed lists are empty by now, but still carry their
+    # attributes (e.g. the count), so parse the rest of the message as
+    # usual and then fill in the items.
+    result = parse_elements([], valid_elements, root)
+    result |= items
     return result
 
 def parse_response_message(message):
@@ -392,7 +469,7 @@ def parse_relation_attribute_element(element):
     result = {}
     for attr in element.attrib:
         if "{" in attr:
-            a = fixtag(attr, NS_MAP)[0]
+            a = _fixtag(attr)
         else:
             a = attr
         result[a] = element.attrib[attr]
@@ -433,7 +510,7 @@ def parse_medium_list(ml):
     medium_list = []
     track_count = None
     for m in ml:
-        tag = fixtag(m.tag, NS_MAP)[0]
+        tag = _fixtag(m.tag)
         if tag == "ws2:medium":
             medium_list.append(parse_medium(m))
         elif tag == "ws2:track-count":
@@ -3,13 +3,14 @@
 # This file is distributed under a BSD-2-Clause type license.
 # See the COPYING file for more information.
 
+import concurrent.futures
+import functools
 import json
-import re
 import threading
 import time
+import types
 import logging
 import urllib.parse
-import xml.etree.ElementTree as etree
 from xml.parsers import expat
 from warnings import warn
 
@@ -17,6 +18,12 @@ import requests
 from requests.auth import HTTPDigestAuth
 from requests.packages.urllib3.util.retry import Retry
 
+try:
+    # orjson is considerably faster than json and parses bytes directly.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 from musicbrainzngs import mbxml
 from musicbrainzngs import util
 from musicbrainzngs.version import version as _version
@@ -25,9 +32,12 @@ _log = logging.getLogger("musicbrainzngs")
 _max_retries = 8
 
 _timeout = 60
+_CHUNK_SIZE = 64 * 1024
 _retry = Retry(total=_max_retries, backoff_factor=2, status_forcelist=[500, 502, 503])
 
 LUCENE_SPECIAL = r'([+\-&|!(){}\[\]\^"~*?:\\\/])'
+# Translation table escaping the characters matched by LUCENE_SPECIAL.
+_LUCENE_ESCAPES = str.maketrans({c: f"\\{c}" for c in '+-&|!(){}[]^"~*?:\\/'})
 
 # Constants for validation.
 
@@ -166,10 +176,20 @@ VALID_SEARCH_FIELDS = {
     ]
 }
 
+# Frozenset copies of the valid values, so that membership tests are
+# constant time. The public lists above are left as they are.
+_VALID_INCLUDES = {k: frozenset(v) for k, v in VALID_INCLUDES.items()}
+_VALID_BROWSE_INCLUDES = {k: frozenset(v)
+                          for k, v in VALID_BROWSE_INCLUDES.items()}
+_VALID_SEARCH_FIELDS = {k: frozenset(v) for k, v in VALID_SEARCH_FIELDS.items()}
+_RELEASE_TYPES = frozenset(VALID_RELEASE_TYPES)
+_RELEASE_STATUSES = frozenset(VALID_RELEASE_STATUSES)
+
 class AUTH_YES: pass
 class AUTH_NO: pass
 class AUTH_IFSET: pass
 AUTH_REQUIRED_INCLUDES = ["user-tags", "user-ratings", "user-genres"]
+_AUTH_REQUIRED_INCLUDES = frozenset(AUTH_REQUIRED_INCLUDES)
 
 
 class MusicBrainzError(Exception):
@@ -235,15 +255,25 @@ class AuthenticationError(WebServiceError):
 
 def _check_includes_impl(includes, valid_includes):
     for i in includes:
-        if i not in valid_includes:
+        try:
+            valid = i in valid_includes
+        except TypeError:
+            # unhashable, e.g. a nested list
+            valid = False
+        if not valid:
             raise InvalidIncludeError("Bad includes: "
-                                      "%s is not a valid include" % i)
+                                      "%s is not a valid include" % (i,))
+
 def _check_includes(entity, inc):
-    _check_includes_impl(inc, VALID_INCLUDES[entity])
+    _check_includes_impl(inc, _VALID_INCLUDES[entity])
 
 def _check_filter(values, valid):
 	for v in values:
-		if v not in valid:
+		try:
+			ok = v in valid
+		except TypeError:
+			ok = False
+		if not ok:
 			raise InvalidFilterError(v)
 
 def _check_filter_and_make_params(entity, includes, release_status=None, release_type=None):
@@ -251,6 +281,8 @@ def _check_filter_and_make_params(entity, includes, release_status=None, release
     the filters can be used with the given includes. Return a params
     dict that can be passed to _do_mb_query.
     """
+	if not release_status and not release_type:
+		return {}
 	if release_status is None:
 		release_status = []
 	if release_type is None:
@@ -259,8 +291,10 @@ def _check_filter_and_make_params(entity, includes, release_status=None, release
 	    release_status = [release_status]
 	if isinstance(release_type, (str, bytes)):
 	    release_type = [release_type]
-	_check_filter(release_status, VALID_RELEASE_STATUSES)
-	_check_filter(release_type, VALID_RELEASE_TYPES)
+	if not isinstance(includes, (list, tuple)):
+	    includes = [includes]
+	_check_filter(release_status, _RELEASE_STATUSES)
+	_check_filter(release_type, _RELEASE_TYPES)
 
 	if (release_status
 	        and "releases" not in includes and entity != "release"):
@@ -279,24 +313,27 @@ def _check_filter_and_make_params(entity, includes, release_status=None, release
 	    params["type"] = "|".join(release_type)
 	return params
 
+# The comma separated lists that are filled into the docstrings,
+# joined once for each entity.
+_INCLUDES_STR = {e: ", ".join(v) for e, v in VALID_INCLUDES.items()}
+_BROWSE_INCLUDES_STR = {e: ", ".join(v)
+                        for e, v in VALID_BROWSE_INCLUDES.items()}
+_SEARCH_FIELDS_STR = {e: ", ".join(v)
+                      for e, v in VALID_SEARCH_FIELDS.items()}
+
 def _docstring_get(entity):
-    includes = list(VALID_INCLUDES.get(entity, []))
-    return _docstring_impl("includes", includes)
+    return _docstring_impl("includes", _INCLUDES_STR.get(entity, ""))
 
 def _docstring_browse(entity):
-    includes = list(VALID_BROWSE_INCLUDES.get(entity, []))
-    return _docstring_impl("includes", includes)
+    return _docstring_impl("includes", _BROWSE_INCLUDES_STR.get(entity, ""))
 
 def _docstring_search(entity):
-    search_fields = list(VALID_SEARCH_FIELDS.get(entity, []))
-    return _docstring_impl("fields", search_fields)
+    return _docstring_impl("fields", _SEARCH_FIELDS_STR.get(entity, ""))
 
-def _docstring_impl(name, values):
+def _docstring_impl(name, vstr):
     def _decorator(func):
-        vstr = ", ".join(values)
-        args = {name: vstr}
         if func.__doc__:
-            func.__doc__ = func.__doc__.format(**args)
+            func.__doc__ = func.__doc__.format(**{name: vstr})
         return func
 
     return _decorator
@@ -309,14 +346,27 @@ hostname = "musicbrainz.org"
 https = True
 _client = ""
 _useragent = ""
+_auth_handler = None
 
 def auth(u, p):
 	"""Set the username and password to be used in subsequent queries to
 	the MusicBrainz XML API that require authentication.
 	"""
-	global user, password
+	global user, password, _auth_handler
 	user = u
 	password = p
+	_auth_handler = None
+
+def _get_auth_handler():
+	"""Return the digest auth handler for the current credentials. The
+	handler is reused between requests so that it keeps the state of
+	the server's last challenge.
+	"""
+	global _auth_handler
+	if (_auth_handler is None or _auth_handler.username != user
+	        or _auth_handler.password != password):
+		_auth_handler = HTTPDigestAuth(user, password)
+	return _auth_handler
 
 def set_useragent(app, version, contact=None):
 	"""Set the User-Agent to be used for requests to the MusicBrainz webservice.
@@ -347,6 +397,12 @@ def set_hostname(new_hostname, use_https=False):
     hostname = new_hostname
     https = use_https
 
+@functools.lru_cache(maxsize=8)
+def _base_url(use_https, host):
+    """Return the URL of the webservice root on `host`."""
+    scheme = 'https' if use_https else 'http'
+    return f"{scheme}://{host}/ws/2/"
+
 # Rate limiting.
 
 limit_interval = 1.0
@@ -379,77 +435,89 @@ class _rate_limit(object):
     """A decorator that limits the rate at which the function may be
     called. The rate is controlled by the `limit_interval` and
     `limit_requests` global variables.  The limiting is thread-safe;
-    only one thread may be in the function at a time (acts like a
-    monitor in this sense). The globals must be set before the first
-    call to the limited function.
+    calls from several threads are started one after the other at the
+    allowed rate, but may then run concurrently. The globals must be
+    set before the first call to the limited function.
     """
     def __init__(self, fun):
         self.fun = fun
-        self.last_call = 0.0
+        self.next_call = 0.0
         self.lock = threading.Lock()
-        self.remaining_requests = None # Set on first invocation.
-
-    def _update_remaining(self):
-        """Update remaining requests based on the elapsed time since
-        they were last calculated.
-        """
-        # On first invocation, we have the maximum number of requests
-        # available.
-        if self.remaining_requests is None:
-            self.remaining_requests = float(limit_requests)
 
-        else:
-            since_last_call = time.time() - self.last_call
-            self.remaining_requests += since_last_call * \
-                                       (limit_requests / limit_interval)
-            self.remaining_requests = min(self.remaining_requests,
-                                          float(limit_requests))
+    def _wait(self):
+        """Sleep until the next call is allowed and book it.
 
-        self.last_call = time.time()
+        Up to `limit_requests` calls may be made back-to-back, after
+        which calls are spaced `limit_interval / limit_requests` apart.
+        `next_call` is the time at which the next call would be due if
+        calls were evenly spaced.
+        """
+        now = time.monotonic()
+        spacing = limit_interval / limit_requests
+        due = max(self.next_call, now)
+        wait = due - (limit_interval - spacing) - now
+        if wait > 0:
+            time.sleep(wait)
+        self.next_call = due + spacing
 
     def __call__(self, *args, **kwargs):
-        with self.lock:
-            if do_rate_limit:
-                self._update_remaining()
-
-                # Delay if necessary.
-                while self.remaining_requests < 0.999:
-                    time.sleep((1.0 - self.remaining_requests) *
-                               (limit_requests / limit_interval))
-                    self._update_remaining()
-
-                # Call the original function, "paying" for this call.
-                self.remaining_requests -= 1.0
-            return self.fun(*args, **kwargs)
+        if do_rate_limit:
+            with self.lock:
+                self._wait()
+        return self.fun(*args, **kwargs)
 
 # Core (internal) functions for calling the MB API.
 
-def _safe_read(request):
+_session = None
+_session_lock = threading.Lock()
+
+def _get_session():
+	"""Return the session shared by all requests, so that connections
+	to the server are kept alive and reused between calls.
+	"""
+	global _session
+	if _session is None:
+		with _session_lock:
+			if _session is None:
+				session = requests.Session()
+				adapter = requests.adapters.HTTPAdapter(
+				    max_retries=_retry, pool_connections=4, pool_maxsize=16)
+				session.mount('http://', adapter)
+				session.mount('https://', adapter)
+				_session = session
+	return _session
+
+def _safe_read(request, stream=False):
 	"""
     :param request:
+    :param stream: if `True`, the body is not downloaded until it is read
     """
 	    # Make request (with retries).
-	with requests.Session() as session:
-		adapter = requests.adapters.HTTPAdapter(max_retries=_retry)
-		session.mount('http://', adapter)
-		session.mount('https://', adapter)
-		try:
-			resp = session.send(request.prepare(), allow_redirects=True, timeout=_timeout)
-			resp.raise_for_status()
-			return resp
-		except requests.HTTPError as exc:
-			if exc.response.status_code == 401:
-				raise AuthenticationError(cause=exc) from exc
-			raise ResponseError(cause=exc) from exc
-		except requests.RequestException as exc:
-			raise NetworkError(cause=exc) from exc
+	session = _get_session()
+	try:
+		resp = session.send(request.prepare(), allow_redirects=True,
+		                    timeout=_timeout, stream=stream)
+		resp.raise_for_status()
+		return resp
+	except requests.HTTPError as exc:
+		if stream:
+			# Read the error body, so the connection goes back to the
+			# pool and the body stays available on the exception.
+			try:
+				exc.response.content
+			except requests.RequestException:
+				pass
+			finally:
+				exc.response.close()
+		if exc.response.status_code == 401:
+			raise AuthenticationError(cause=exc) from exc
+		raise ResponseError(cause=exc) from exc
+	except requests.RequestException as exc:
+		raise NetworkError(cause=exc) from exc
 
-# Get the XML parsing exceptions to catch. The behavior chnaged with Python 2.7
-# and ElementTree 1.3.
-if hasattr(etree, 'ParseError'):
-	ETREE_EXCEPTIONS = (etree.ParseError, expat.ExpatError)
-else:
-	ETREE_EXCEPTIONS = (expat.ExpatError)
+# Get the XML parsing exceptions to catch. These include lxml's errors
+# when it is installed, see set_lxml().
+ETREE_EXCEPTIONS = util.PARSE_ERRORS + (expat.ExpatError,)
 
 
 # Parsing setup
@@ -459,7 +527,10 @@ def mb_parser_null(resp):
     return resp
 
 def mb_parser_xml(resp):
-	"""Return a Python dict representing the XML response"""
+	"""Return a Python dict representing the XML response. `resp` may
+	also be a file-like object or an iterable of byte strings, which are
+	parsed incrementally.
+	"""
 	    # Parse the response.
 	try:
 		return mbxml.parse_message(resp)
@@ -507,10 +578,18 @@ def set_format(fmt="xml"):
 	elif fmt == "json":
 	    ws_format = fmt
 	    warn("The json format is non-official and may change at any time")
-	    set_parser(json.loads)
+	    set_parser(_json_loads)
 	else:
 		raise ValueError(f"invalid format: {fmt}")
 
+def set_lxml(use_lxml=True):
+	"""Sets whether XML responses are parsed with
+	`lxml <https://lxml.de/>`_ instead of the standard library
+	ElementTree, which is the default. Both give the same results.
+	Raises ImportError if lxml isn't installed.
+	"""
+	util.set_lxml(use_lxml)
+
 
 @_rate_limit
 def _mb_request(path, method='GET', auth_required=AUTH_NO,
@@ -523,10 +602,7 @@ def _mb_request(path, method='GET', auth_required=AUTH_NO,
     """
 	global parser_fun
 
-	if args is None:
-	    args = {}
-	else:
-	    args = dict(args) or {}
+	args = {} if args is None else dict(args)
 
 	if _useragent == "":
 	    raise UsageError("set a proper user-agent with "
@@ -549,28 +625,16 @@ def _mb_request(path, method='GET', auth_required=AUTH_NO,
 	    # will be sent (avoids HTTP 411 error).
 	    headers['Content-Length'] = '0'
 
-	# Convert args from a dictionary to a list of tuples
-	# so that the ordering of elements is stable for easy
-	# testing (in this case we order alphabetically)
-	# Encode Unicode arguments using UTF-8.
-	newargs = []
-	for key, value in sorted(args.items()):
-	    if isinstance(value, str):
-	        value = value.encode('utf8')
-	    newargs.append((key, value))
-
-	    # Construct the full URL for the request, including hostname and
-	    # query string.
-	url = urllib.parse.urlunparse(
-		(
-			'https' if https else 'http',
-			hostname,
-			f'/ws/2/{path}',
-			'',
-			urllib.parse.urlencode(newargs),
-			'',
-		)
-	)
+	# Sort the arguments so that the ordering of elements is stable
+	# for easy testing (in this case we order alphabetically).
+	# urlencode encodes Unicode arguments using UTF-8.
+	query = urllib.parse.urlencode(sorted(args.items()), encoding='utf-8')
+
+	# Construct the full URL for the request, including hostname and
+	# query string.
+	url = _base_url(https, hostname) + path
+	if query:
+		url = f"{url}?{query}"
 
 	# Add credentials if required.
 	add_auth = False
@@ -586,7 +650,7 @@ def _mb_request(path, method='GET', auth_required=AUTH_NO,
 		add_auth = True
 
 	if add_auth:
-	    auth_handler = HTTPDigestAuth(user, password)
+	    auth_handler = _get_auth_handler()
 	else:
 	    auth_handler = None
 
@@ -602,18 +666,28 @@ def _mb_request(path, method='GET', auth_required=AUTH_NO,
 	    data=body,
 	)
 
-	resp = _safe_read(req)
+	if parser_fun is not mb_parser_xml:
+		resp = _safe_read(req)
+		return parser_fun(resp.content)
 
-	return parser_fun(resp.content)
+	# The default parser consumes the body as it arrives instead of
+	# waiting for the whole document.
+	resp = _safe_read(req, stream=True)
+	try:
+		return parser_fun(resp.iter_content(_CHUNK_SIZE))
+	except requests.RequestException as exc:
+		raise NetworkError(cause=exc) from exc
+	finally:
+		resp.close()
 
 
 def _get_auth_type(entity, id, includes):
     """ Some calls require authentication. This returns
     a constant (Yes, No, IfSet) for the auth status of the call.
     """
-    if "user-tags" in includes or "user-ratings" in includes or "user-genres" in includes:
+    if not _AUTH_REQUIRED_INCLUDES.isdisjoint(includes):
         return AUTH_YES
-    elif entity.startswith("collection"):
+    elif entity == "collection":
         if not id:
             return AUTH_YES
         else:
@@ -622,6 +696,9 @@ def _get_auth_type(entity, id, includes):
         return AUTH_NO
 
 
+# Shared, read-only params for queries that don't need any.
+_EMPTY_PARAMS = types.MappingProxyType({})
+
 def _do_mb_query(entity, id, includes=None, params=None):
 	"""Make a single GET call to the MusicBrainz XML API. `entity` is a
 	string indicated the type of object to be retrieved. The id may be
@@ -635,9 +712,10 @@ def _do_mb_query(entity, id, includes=None, params=None):
 	if params is None:
 		params = {}
 	# Build arguments.
-	if not isinstance(includes, list):
+	if not isinstance(includes, (list, tuple)):
 		includes = [includes]
-	_check_includes(entity, includes)
+	if includes:
+		_check_includes(entity, includes)
 	auth_required = _get_auth_type(entity, id, includes)
 	args = dict(params)
 	if len(includes) > 0:
@@ -662,24 +740,24 @@ def _do_mb_search(entity, query='', fields=None, limit=None, offset=None, strict
 	if query:
 		clean_query = util._unicode(query)
 		if fields:
-			clean_query = re.sub(LUCENE_SPECIAL, r'\\\1',
-					     clean_query)
+			clean_query = clean_query.translate(_LUCENE_ESCAPES)
 			if strict:
 				query_parts.append(f'"{clean_query}"')
 			else:
 				query_parts.append(clean_query.lower())
 		else:
 			query_parts.append(clean_query)
+	valid_fields = _VALID_SEARCH_FIELDS[entity]
 	for key, value in fields.items():
 		# Ensure this is a valid search field.
-		if key not in VALID_SEARCH_FIELDS[entity]:
+		if key not in valid_fields:
 			raise InvalidSearchFieldError(
 				f'{key} is not a valid search field for {entity}'
 			)
 
 		# Escape Lucene's special characters.
 		value = util._unicode(value)
-		if value := re.sub(LUCENE_SPECIAL, r'\\\1', value):
+		if value := value.translate(_LUCENE_ESCAPES):
 			if strict:
 				query_parts.append(f'{key}:"{value}"')
 			else:
@@ -723,262 +801,165 @@ def _do_mb_post(path, body):
 
 # Single entity by ID
 
-@_docstring_get("area")
-def get_area_by_id(id, includes=None, release_status=None, release_type=None):
-	"""Get the area with the MusicBrainz `id` as a dict with an 'area' key.
-
-    *Available includes*: {includes}"""
+def _get_by_id(entity, id, includes=None, release_status=None, release_type=None):
 	if includes is None:
 		includes = []
-	if release_status is None:
-		release_status = []
-	if release_type is None:
-		release_type = []
-	params = _check_filter_and_make_params("area", includes,
+	params = _check_filter_and_make_params(entity, includes,
 	                                       release_status, release_type)
-	return _do_mb_query("area", id, includes, params)
+	return _do_mb_query(entity, id, includes, params)
 
-@_docstring_get("artist")
-def get_artist_by_id(id, includes=None, release_status=None, release_type=None):
+def _make_get_by_id(entity, doc, filters=True):
+	"""Return the get_<entity>_by_id function for `entity` with the
+	docstring `doc`. If `filters` is False, the function doesn't take
+	release status and type filters.
+	"""
+	if filters:
+		def get_by_id(id, includes=None, release_status=None, release_type=None):
+			return _get_by_id(entity, id, includes, release_status, release_type)
+	else:
+		def get_by_id(id, includes=None):
+			return _get_by_id(entity, id, includes)
+	name = f"get_{entity.replace('-', '_')}_by_id"
+	get_by_id.__name__ = get_by_id.__qualname__ = name
+	get_by_id.__doc__ = doc
+	return _docstring_get(entity)(get_by_id)
+
+get_area_by_id = _make_get_by_id("area",
+	"""Get the area with the MusicBrainz `id` as a dict with an 'area' key.
+
+    *Available includes*: {includes}""")
+
+get_artist_by_id = _make_get_by_id("artist",
 	"""Get the artist with the MusicBrainz `id` as a dict with an 'artist' key.
 
-    *Available includes*: {includes}"""
-	if includes is None:
-		includes = []
-	if release_status is None:
-		release_status = []
-	if release_type is None:
-		release_type = []
-	params = _check_filter_and_make_params("artist", includes,
-	                                       release_status, release_type)
-	return _do_mb_query("artist", id, includes, params)
+    *Available includes*: {includes}""")
 
-@_docstring_get("instrument")
-def get_instrument_by_id(id, includes=None, release_status=None, release_type=None):
+get_instrument_by_id = _make_get_by_id("instrument",
 	"""Get the instrument with the MusicBrainz `id` as a dict with an 'artist' key.
 
-    *Available includes*: {includes}"""
-	if includes is None:
-		includes = []
-	if release_status is None:
-		release_status = []
-	if release_type is None:
-		release_type = []
-	params = _check_filter_and_make_params("instrument", includes,
-	                                       release_status, release_type)
-	return _do_mb_query("instrument", id, includes, params)
+    *Available includes*: {includes}""")
 
-@_docstring_get("label")
-def get_label_by_id(id, includes=None, release_status=None, release_type=None):
+get_label_by_id = _make_get_by_id("label",
 	"""Get the label with the MusicBrainz `id` as a dict with a 'label' key.
 
-    *Available includes*: {includes}"""
-	if includes is None:
-		includes = []
-	if release_status is None:
-		release_status = []
-	if release_type is None:
-		release_type = []
-	params = _check_filter_and_make_params("label", includes,
-	                                       release_status, release_type)
-	return _do_mb_query("label", id, includes, params)
+    *Available includes*: {includes}""")
 
-@_docstring_get("place")
-def get_place_by_id(id, includes=None, release_status=None, release_type=None):
+get_place_by_id = _make_get_by_id("place",
 	"""Get the place with the MusicBrainz `id` as a dict with an 'place' key.
 
-    *Available includes*: {includes}"""
-	if includes is None:
-		includes = []
-	if release_status is None:
-		release_status = []
-	if release_type is None:
-		release_type = []
-	params = _check_filter_and_make_params("place", includes,
-	                                       release_status, release_type)
-	return _do_mb_query("place", id, includes, params)
+    *Available includes*: {includes}""")
 
-@_docstring_get("event")
-def get_event_by_id(id, includes=None, release_status=None, release_type=None):
+get_event_by_id = _make_get_by_id("event",
 	"""Get the event with the MusicBrainz `id` as a dict with an 'event' key.
 
     The event dict has the following keys:
     `id`, `type`, `name`, `time`, `disambiguation` and `life-span`.
 
-    *Available includes*: {includes}"""
-	if includes is None:
-		includes = []
-	if release_status is None:
-		release_status = []
-	if release_type is None:
-		release_type = []
-	params = _check_filter_and_make_params("event", includes,
-	                                       release_status, release_type)
-	return _do_mb_query("event", id, includes, params)
+    *Available includes*: {includes}""")
 
-@_docstring_get("recording")
-def get_recording_by_id(id, includes=None, release_status=None, release_type=None):
+get_recording_by_id = _make_get_by_id("recording",
 	"""Get the recording with the MusicBrainz `id` as a dict
     with a 'recording' key.
 
-    *Available includes*: {includes}"""
-	if includes is None:
-		includes = []
-	if release_status is None:
-		release_status = []
-	if release_type is None:
-		release_type = []
-	params = _check_filter_and_make_params("recording", includes,
-	                                       release_status, release_type)
-	return _do_mb_query("recording", id, includes, params)
+    *Available includes*: {includes}""")
 
-@_docstring_get("release")
-def get_release_by_id(id, includes=None, release_status=None, release_type=None):
+get_release_by_id = _make_get_by_id("release",
 	"""Get the release with the MusicBrainz `id` as a dict with a 'release' key.
 
-    *Available includes*: {includes}"""
-	if includes is None:
-		includes = []
-	if release_status is None:
-		release_status = []
-	if release_type is None:
-		release_type = []
-	params = _check_filter_and_make_params("release", includes,
-	                                       release_status, release_type)
-	return _do_mb_query("release", id, includes, params)
+    *Available includes*: {includes}""")
 
-@_docstring_get("release-group")
-def get_release_group_by_id(id, includes=None, release_status=None, release_type=None):
+get_release_group_by_id = _make_get_by_id("release-group",
 	"""Get the release group with the MusicBrainz `id` as a dict
     with a 'release-group' key.
 
-    *Available includes*: {includes}"""
-	if includes is None:
-		includes = []
-	if release_status is None:
-		release_status = []
-	if release_type is None:
-		release_type = []
-	params = _check_filter_and_make_params("release-group", includes,
-	                                       release_status, release_type)
-	return _do_mb_query("release-group", id, includes, params)
+    *Available includes*: {includes}""")
 
-@_docstring_get("series")
-def get_series_by_id(id, includes=None):
+get_series_by_id = _make_get_by_id("series",
 	"""Get the series with the MusicBrainz `id` as a dict with a 'series' key.
 
-    *Available includes*: {includes}"""
-	if includes is None:
-		includes = []
-	return _do_mb_query("series", id, includes)
+    *Available includes*: {includes}""", filters=False)
 
-@_docstring_get("work")
-def get_work_by_id(id, includes=None):
+get_work_by_id = _make_get_by_id("work",
 	"""Get the work with the MusicBrainz `id` as a dict with a 'work' key.
 
-    *Available includes*: {includes}"""
-	if includes is None:
-		includes = []
-	return _do_mb_query("work", id, includes)
+    *Available includes*: {includes}""", filters=False)
 
-@_docstring_get("url")
-def get_url_by_id(id, includes=None):
+get_url_by_id = _make_get_by_id("url",
 	"""Get the url with the MusicBrainz `id` as a dict with a 'url' key.
 
-    *Available includes*: {includes}"""
-	if includes is None:
-		includes = []
-	return _do_mb_query("url", id, includes)
-
-
-# Searching
-
-@_docstring_search("annotation")
-def search_annotations(query='', limit=None, offset=None, strict=False, **fields):
-    """Search for annotations and return a dict with an 'annotation-list' key.
-
-    *Available search fields*: {fields}"""
-    return _do_mb_search('annotation', query, fields, limit, offset, strict)
-
-@_docstring_search("area")
-def search_areas(query='', limit=None, offset=None, strict=False, **fields):
-    """Search for areas and return a dict with an 'area-list' key.
-
-    *Available search fields*: {fields}"""
-    return _do_mb_search('area', query, fields, limit, offset, strict)
-
-@_docstring_search("artist")
-def search_artists(query='', limit=None, offset=None, strict=False, **fields):
-    """Search for artists and return a dict with an 'artist-list' key.
-
-    *Available search fields*: {fields}"""
-    return _do_mb_search('artist', query, fields, limit, offset, strict)
-
-@_docstring_search("event")
-def search_events(query='', limit=None, offset=None, strict=False, **fields):
-    """Search for events and return a dict with an 'event-list' key.
-
-    *Available search fields*: {fields}"""
-    return _do_mb_search('event', query, fields, limit, offset, strict)
-
-@_docstring_search("instrument")
-def search_instruments(query='', limit=None, offset=None, strict=False, **fields):
-    """Search for instruments and return a dict with a 'instrument-list' key.
-
-    *Available search fields*: {fields}"""
-    return _do_mb_search('instrument', query, fields, limit, offset, strict)
-
-@_docstring_search("label")
-def search_labels(query='', limit=None, offset=None, strict=False, **fields):
-    """Search for labels and return a dict with a 'label-list' key.
-
-    *Available search fields*: {fields}"""
-    return _do_mb_search('label', query, fields, limit, offset, strict)
-
-@_docstring_search("place")
-def search_places(query='', limit=None, offset=None, strict=False, **fields):
-    """Search for places and return a dict with a 'place-list' key.
+    *Available includes*: {includes}""", filters=False)
 
-    *Available search fields*: {fields}"""
-    return _do_mb_search('place', query, fields, limit, offset, strict)
+_LOOKUP_ENTITIES = frozenset([
+	"area", "artist", "instrument", "label", "place", "event", "recording",
+	"release", "release-group", "series", "work", "url"])
 
-@_docstring_search("recording")
-def search_recordings(query='', limit=None, offset=None,
-                      strict=False, **fields):
-    """Search for recordings and return a dict with a 'recording-list' key.
+def get_many_by_id(entity, ids, includes=None, release_status=None,
+                   release_type=None, max_workers=None):
+	"""Get several entities of the type `entity` (e.g. 'artist' or
+	'release-group') by their MusicBrainz `ids`. Returns a list with
+	the result for each ID, in order, like the corresponding
+	get_*_by_id function would.
 
-    *Available search fields*: {fields}"""
-    return _do_mb_search('recording', query, fields, limit, offset, strict)
-
-@_docstring_search("release")
-def search_releases(query='', limit=None, offset=None, strict=False, **fields):
-    """Search for recordings and return a dict with a 'recording-list' key.
-
-    *Available search fields*: {fields}"""
-    return _do_mb_search('release', query, fields, limit, offset, strict)
-
-@_docstring_search("release-group")
-def search_release_groups(query='', limit=None, offset=None,
-			  strict=False, **fields):
-    """Search for release groups and return a dict
-    with a 'release-group-list' key.
-
-    *Available search fields*: {fields}"""
-    return _do_mb_search('release-group', query, fields, limit, offset, strict)
-
-@_docstring_search("series")
-def search_series(query='', limit=None, offset=None, strict=False, **fields):
-    """Search for series and return a dict with a 'series-list' key.
+	The requests are made from up to `max_workers` threads, by default
+	twice the number of requests allowed by :func:`set_rate_limit`, so
+	that waiting for the server overlaps with the rate limit delay.
+	The rate limit is still respected.
+	"""
+	if entity not in _LOOKUP_ENTITIES:
+		raise UsageError(f"can't get entities of type {entity} by id")
+	if includes is None:
+		includes = []
+	elif not isinstance(includes, (list, tuple)):
+		includes = [includes]
+	# Report invalid arguments once instead of from every thread.
+	_check_includes(entity, includes)
+	_check_filter_and_make_params(entity, includes, release_status, release_type)
+	if max_workers is None:
+		max_workers = max(1, int(2 * limit_requests))
+
+	get = functools.partial(_get_by_id, entity, includes=includes,
+	                        release_status=release_status,
+	                        release_type=release_type)
+	executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+	try:
+		return list(executor.map(get, ids))
+	finally:
+		executor.shutdown(cancel_futures=True)
 
-    *Available search fields*: {fields}"""
-    return _do_mb_search('series', query, fields, limit, offset, strict)
 
-@_docstring_search("work")
-def search_works(query='', limit=None, offset=None, strict=False, **fields):
-    """Search for works and return a dict with a 'work-list' key.
+# Searching
 
-    *Available search fields*: {fields}"""
-    return _do_mb_search('work', query, fields, limit, offset, strict)
+def _make_search(entity, plural):
+    """Return the search function for `entity`, named after `plural`."""
+    def search(query='', limit=None, offset=None, strict=False, **fields):
+        return _do_mb_search(entity, query, fields, limit, offset, strict)
+    search.__name__ = search.__qualname__ = f"search_{plural.replace(' ', '_')}"
+    article = "an" if entity[0] in "aeiou" else "a"
+    search.__doc__ = f"""Search for {plural} and return a dict with {article} '{entity}-list' key.
+
+    *Available search fields*: {{fields}}"""
+    return _docstring_search(entity)(search)
+
+_SEARCH_FUNCS = {entity: _make_search(entity, plural) for entity, plural in [
+    ("annotation", "annotations"), ("area", "areas"), ("artist", "artists"),
+    ("event", "events"), ("instrument", "instruments"), ("label", "labels"),
+    ("place", "places"), ("recording", "recordings"), ("release", "releases"),
+    ("release-group", "release groups"), ("series", "series"),
+    ("work", "works"),
+]}
+
+search_annotations = _SEARCH_FUNCS["annotation"]
+search_areas = _SEARCH_FUNCS["area"]
+search_artists = _SEARCH_FUNCS["artist"]
+search_events = _SEARCH_FUNCS["event"]
+search_instruments = _SEARCH_FUNCS["instrument"]
+search_labels = _SEARCH_FUNCS["label"]
+search_places = _SEARCH_FUNCS["place"]
+search_recordings = _SEARCH_FUNCS["recording"]
+search_releases = _SEARCH_FUNCS["release"]
+search_release_groups = _SEARCH_FUNCS["release-group"]
+search_series = _SEARCH_FUNCS["series"]
+search_works = _SEARCH_FUNCS["work"]
 
 
 # Lists of entities
@@ -1048,17 +1029,32 @@ def get_works_by_iswc(iswc, includes=None):
 	return _do_mb_query("iswc", iswc, includes)
 
 
-def _browse_impl(entity, includes, limit, offset, params, release_status=None, release_type=None):
-	if release_status is None:
-		release_status = []
-	if release_type is None:
-		release_type = []
-	includes = includes if isinstance(includes, list) else [includes]
-	valid_includes = VALID_BROWSE_INCLUDES[entity]
+# The MusicBrainz IDs each browse function accepts, in the order the
+# values are passed to _browse_impl.
+_BROWSE_KEYS = {
+	"artist": ("recording", "release", "release-group", "work"),
+	"event": ("area", "artist", "place"),
+	"label": ("release",),
+	"place": ("area",),
+	"recording": ("artist", "release"),
+	"release": ("artist", "track_artist", "label", "recording",
+	            "release-group"),
+	"release-group": ("artist", "release"),
+	"url": ("resource",),
+	"work": ("artist",),
+}
+
+def _browse_impl(entity, includes, limit, offset, values, release_status=None, release_type=None):
+	includes = includes if isinstance(includes, (list, tuple)) else [includes]
+	valid_includes = _VALID_BROWSE_INCLUDES[entity]
 	_check_includes_impl(includes, valid_includes)
-	p = {k: v for k, v in params.items() if v}
-	if len(p) > 1:
-	    raise Exception("Can't have more than one of " + ", ".join(params.keys()))
+	keys = _BROWSE_KEYS[entity]
+	p = {}
+	for k, v in zip(keys, values):
+		if v:
+			if p:
+				raise Exception("Can't have more than one of " + ", ".join(keys))
+			p[k] = v
 	if limit: p["limit"] = limit
 	if offset: p["offset"] = offset
 	filterp = _check_filter_and_make_params(entity, includes, release_status, release_type)
@@ -1076,11 +1072,8 @@ def browse_artists(recording=None, release=None, release_group=None, work=None,
     *Available includes*: {includes}"""
 	if includes is None:
 		includes = []
-	params = {"recording": recording,
-	          "release": release,
-	          "release-group": release_group,
-	          "work": work}
-	return _browse_impl("artist", includes, limit, offset, params)
+	values = (recording, release, release_group, work)
+	return _browse_impl("artist", includes, limit, offset, values)
 
 @_docstring_browse("event")
 def browse_events(area=None, artist=None, place=None, includes=None, limit=None, offset=None):
@@ -1090,10 +1083,8 @@ def browse_events(area=None, artist=None, place=None, includes=None, limit=None,
     *Available includes*: {includes}"""
 	if includes is None:
 		includes = []
-	params = {"area": area,
-	          "artist": artist,
-	          "place": place}
-	return _browse_impl("event", includes, limit, offset, params)
+	values = (area, artist, place)
+	return _browse_impl("event", includes, limit, offset, values)
 
 @_docstring_browse("label")
 def browse_labels(release=None, includes=None, limit=None, offset=None):
@@ -1102,8 +1093,8 @@ def browse_labels(release=None, includes=None, limit=None, offset=None):
     *Available includes*: {includes}"""
 	if includes is None:
 		includes = []
-	params = {"release": release}
-	return _browse_impl("label", includes, limit, offset, params)
+	values = (release,)
+	return _browse_impl("label", includes, limit, offset, values)
 
 @_docstring_browse("place")
 def browse_places(area=None, includes=None, limit=None, offset=None):
@@ -1112,8 +1103,8 @@ def browse_places(area=None, includes=None, limit=None, offset=None):
     *Available includes*: {includes}"""
 	if includes is None:
 		includes = []
-	params = {"area": area}
-	return _browse_impl("place", includes, limit, offset, params)
+	values = (area,)
+	return _browse_impl("place", includes, limit, offset, values)
 
 @_docstring_browse("recording")
 def browse_recordings(artist=None, release=None, includes=None, limit=None, offset=None):
@@ -1123,9 +1114,8 @@ def browse_recordings(artist=None, release=None, includes=None, limit=None, offs
     *Available includes*: {includes}"""
 	if includes is None:
 		includes = []
-	params = {"artist": artist,
-	          "release": release}
-	return _browse_impl("recording", includes, limit, offset, params)
+	values = (artist, release)
+	return _browse_impl("recording", includes, limit, offset, values)
 
 @_docstring_browse("release")
 def browse_releases(artist=None, track_artist=None, label=None, recording=None, release_group=None, release_status=None, release_type=None, includes=None, limit=None, offset=None):
@@ -1146,13 +1136,9 @@ def browse_releases(artist=None, track_artist=None, label=None, recording=None,
 	if includes is None:
 		includes = []
 	# track_artist param doesn't work yet
-	params = {"artist": artist,
-	          "track_artist": track_artist,
-	          "label": label,
-	          "recording": recording,
-	          "release-group": release_group}
+	values = (artist, track_artist, label, recording, release_group)
 	return _browse_impl("release", includes, limit, offset,
-	                    params, release_status, release_type)
+	                    values, release_status, release_type)
 
 @_docstring_browse("release-group")
 def browse_release_groups(artist=None, release=None, release_type=None, includes=None, limit=None, offset=None):
@@ -1166,10 +1152,9 @@ def browse_release_groups(artist=None, release=None, release_type=None, includes
 		release_type = []
 	if includes is None:
 		includes = []
-	params = {"artist": artist,
-	          "release": release}
+	values = (artist, release)
 	return _browse_impl("release-group", includes, limit,
-	                    offset, params, [], release_type)
+	                    offset, values, [], release_type)
 
 @_docstring_browse("url")
 def browse_urls(resource=None, includes=None, limit=None, offset=None):
@@ -1179,8 +1164,8 @@ def browse_urls(resource=None, includes=None, limit=None, offset=None):
     *Available includes*: {includes}"""
 	if includes is None:
 		includes = []
-	params = {"resource": resource}
-	return _browse_impl("url", includes, limit, offset, params)
+	values = (resource,)
+	return _browse_impl("url", includes, limit, offset, values)
 
 @_docstring_browse("work")
 def browse_works(artist=None, includes=None, limit=None, offset=None):
@@ -1189,8 +1174,8 @@ def browse_works(artist=None, includes=None, limit=None, offset=None):
     *Available includes*: {includes}"""
 	if includes is None:
 		includes = []
-	params = {"artist": artist}
-	return _browse_impl("work", includes, limit, offset, params)
+	values = (artist,)
+	return _browse_impl("work", includes, limit, offset, values)
 
 # Collections
 def get_collections():
@@ -1200,60 +1185,38 @@ def get_collections():
     return _do_mb_query("collection", '')
 
 def _do_collection_query(collection, collection_type, limit, offset):
+	path = f"{collection}/{collection_type}"
+	if not limit and not offset:
+		return _do_mb_query("collection", path, (), _EMPTY_PARAMS)
 	params = {}
 	if limit: params["limit"] = limit
 	if offset: params["offset"] = offset
-	return _do_mb_query(
-		"collection", f"{collection}/{collection_type}", [], params
-	)
-
-def get_artists_in_collection(collection, limit=None, offset=None):
-    """List the artists in a collection.
-    Returns a dict with a 'collection' key, which again has a 'artist-list'.
-
-    See `Browsing`_ for how to use `limit` and `offset`.
-    """
-    return _do_collection_query(collection, "artists", limit, offset)
-
-def get_releases_in_collection(collection, limit=None, offset=None):
-    """List the releases in a collection.
-    Returns a dict with a 'collection' key, which again has a 'release-list'.
-
-    See `Browsing`_ for how to use `limit` and `offset`.
-    """
-    return _do_collection_query(collection, "releases", limit, offset)
-
-def get_events_in_collection(collection, limit=None, offset=None):
-    """List the events in a collection.
-    Returns a dict with a 'collection' key, which again has a 'event-list'.
-
-    See `Browsing`_ for how to use `limit` and `offset`.
-    """
-    return _do_collection_query(collection, "events", limit, offset)
-
-def get_places_in_collection(collection, limit=None, offset=None):
-    """List the places in a collection.
-    Returns a dict with a 'collection' key, which again has a 'place-list'.
-
-    See `Browsing`_ for how to use `limit` and `offset`.
-    """
-    return _do_collection_query(collection, "places", limit, offset)
-
-def get_recordings_in_collection(collection, limit=None, offset=None):
-    """List the recordings in a collection.
-    Returns a dict with a 'collection' key, which again has a 'recording-list'.
+	return _do_mb_query("collection", path, (), params)
+
+def _make_collection_query(collection_type):
+    """Return the function listing the `collection_type` (e.g. 'artists')
+    in a collection."""
+    def get_in_collection(collection, limit=None, offset=None):
+        return _do_collection_query(collection, collection_type, limit, offset)
+    get_in_collection.__name__ = get_in_collection.__qualname__ = \
+        f"get_{collection_type}_in_collection"
+    get_in_collection.__doc__ = f"""List the {collection_type} in a collection.
+    Returns a dict with a 'collection' key, which again has a '{collection_type[:-1]}-list'.
 
     See `Browsing`_ for how to use `limit` and `offset`.
     """
-    return _do_collection_query(collection, "recordings", limit, offset)
+    return get_in_collection
 
-def get_works_in_collection(collection, limit=None, offset=None):
-    """List the works in a collection.
-    Returns a dict with a 'collection' key, which again has a 'work-list'.
+_COLLECTION_FUNCS = {collection_type: _make_collection_query(collection_type)
+                     for collection_type in ["artists", "releases", "events",
+                                             "places", "recordings", "works"]}
 
-    See `Browsing`_ for how to use `limit` and `offset`.
-    """
-    return _do_collection_query(collection, "works", limit, offset)
+get_artists_in_collection = _COLLECTION_FUNCS["artists"]
+get_releases_in_collection = _COLLECTION_FUNCS["releases"]
+get_events_in_collection = _COLLECTION_FUNCS["events"]
+get_places_in_collection = _COLLECTION_FUNCS["places"]
+get_recordings_in_collection = _COLLECTION_FUNCS["recordings"]
+get_works_in_collection = _COLLECTION_FUNCS["works"]
 
 
 # Submission methods
@@ -1267,10 +1230,10 @@ def submit_barcodes(release_barcode):
 def submit_isrcs(recording_isrcs):
 	"""Submit ISRCs.
     Submits a set of {recording-id1: [isrc1, ...], ...}
-    or {recording_id1: isrc, ...}.
+    or {recording_id1: isrc, ...}. Tuples of ISRCs work like lists.
     """
 	rec2isrcs = {
-		rec: isrcs if isinstance(isrcs, list) else [isrcs]
+		rec: isrcs if isinstance(isrcs, (list, tuple)) else [isrcs]
 		for rec, isrcs in recording_isrcs.items()
 	}
 	query = mbxml.make_isrc_request(rec2isrcs)
@@ -1288,11 +1251,11 @@ def submit_tags(**kwargs):
     removing tags as necessary. Submitting an empty list for an entity
     will remove all tags for that entity by the user.
     """
-    for k, v in kwargs.items():
-        for id, tags in v.items():
-            kwargs[k][id] = tags if isinstance(tags, list) else [tags]
-
-    query = mbxml.make_tag_request(**kwargs)
+    tags = {
+        k: {id: t if isinstance(t, list) else [t] for id, t in v.items()}
+        for k, v in kwargs.items()
+    }
+    query = mbxml.make_tag_request(**tags)
     return _do_mb_post("tag", query)
 
 def submit_ratings(**kwargs):
@@ -1307,21 +1270,43 @@ def submit_ratings(**kwargs):
     query = mbxml.make_rating_request(**kwargs)
     return _do_mb_post("rating", query)
 
+# The maximum URI length of 16kb leaves room for about 400 release MBIDs
+# per request.
+_COLLECTION_CHUNK_SIZE = 400
+
+def _do_collection_releases(request, collection, releases):
+	"""Call `request` (:func:`_do_mb_put` or :func:`_do_mb_delete`) for
+	the releases of `collection`, using as many requests as needed to
+	stay within the URI length limit. Returns the last response.
+	"""
+	releases = list(releases)
+	# Check all of them before sending anything, so that a bad id
+	# doesn't leave the collection half updated.
+	for release in releases:
+		if len(release) != 36:
+			raise UsageError(f"not a release MBID: {release!r}")
+	res = None
+	for i in range(0, max(len(releases), 1), _COLLECTION_CHUNK_SIZE):
+		releaselist = ";".join(releases[i:i + _COLLECTION_CHUNK_SIZE])
+		res = request(f"collection/{collection}/releases/{releaselist}")
+	return res
+
 def add_releases_to_collection(collection, releases=None):
 	"""Add releases to a collection.
     Collection and releases should be identified by their MBIDs
+
+    Large numbers of releases are sent in several requests.
     """
 	if releases is None:
 		releases = []
-	# XXX: Maximum URI length of 16kb means we should only allow ~400 releases
-	releaselist = ";".join(releases)
-	return _do_mb_put(f"collection/{collection}/releases/{releaselist}")
+	return _do_collection_releases(_do_mb_put, collection, releases)
 
 def remove_releases_from_collection(collection, releases=None):
 	"""Remove releases from a collection.
     Collection and releases should be identified by their MBIDs
+
+    Large numbers of releases are sent in several requests.
     """
 	if releases is None:
 		releases = []
-	releaselist = ";".join(releases)
-	return _do_mb_delete(f"collection/{collection}/releases/{releaselist}")
+	return _do_collection_releases(_do_mb_delete, collection, releases)
@@ -3,11 +3,35 @@
 # This file is distributed under a BSD-2-Clause type license.
 # See the COPYING file for more information.
 
+import codecs
 import io
 import sys
 import locale
 import xml.etree.ElementTree as ET
 
+try:
+    from lxml import etree as _lxml
+except ImportError:
+    _lxml = None
+
+if _lxml is not None:
+    #: Exceptions raised by the XML backend for malformed input.
+    PARSE_ERRORS = (ET.ParseError, _lxml.XMLSyntaxError)
+else:
+    PARSE_ERRORS = (ET.ParseError,)
+
+# The lxml etree module while it is used for parsing, see set_lxml().
+_lxml_etree = None
+
+def set_lxml(enabled):
+    """Parse with lxml instead of the standard library ElementTree if
+    `enabled` is true. Raises ImportError if lxml isn't installed.
+    """
+    global _lxml_etree
+    if enabled and _lxml is None:
+        raise ImportError("lxml is not installed")
+    _lxml_etree = _lxml if enabled else None
+
 def _unicode(string, encoding=None):
     """Try to decode byte strings to unicode.
     This can only be a guess, but this might be better than failing.
@@ -26,9 +50,18 @@ def _unicode(string, encoding=None):
         unicode_string = str(string)
     return unicode_string.replace('\x00', '').strip()
 
+def _lxml_parser():
+    # Never fetch or expand external resources referenced by a response.
+    return _lxml_etree.XMLParser(huge_tree=False, resolve_entities=False,
+                                 no_network=True, remove_comments=True,
+                                 remove_pis=True)
+
 def bytes_to_elementtree(bytes_or_file):
     """Given a bytestring or a file-like object that will produce them,
     parse and return an ElementTree.
+
+    The standard library ElementTree is used unless lxml was selected
+    with set_lxml().
     """
 
     if isinstance(bytes_or_file, (str, bytes)):
@@ -38,5 +71,45 @@ def bytes_to_elementtree(bytes_or_file):
 
     strofborf = _unicode(borf, "utf-8")
 
+    if _lxml_etree is not None:
+        root = _lxml_etree.fromstring(strofborf.encode("utf-8"), _lxml_parser())
+        return _lxml_etree.ElementTree(root)
+
     fileio = io.StringIO(strofborf)
     return ET.ElementTree(file=fileio)
+
+def _clean_chunks(chunks):
+    """Apply the same cleanup as _unicode() to a stream of byte strings:
+    decode as UTF-8 ignoring errors, remove NUL characters and leading
+    whitespace. Yields UTF-8 encoded byte strings.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")("ignore")
+    head = True
+    for chunk in chunks:
+        text = decoder.decode(chunk).replace('\x00', '')
+        if head:
+            text = text.lstrip()
+            head = not text
+        if text:
+            yield text.encode("utf-8")
+    # Any incomplete sequence at the end is dropped, like "ignore" does.
+    decoder.decode(b"", final=True)
+
+def iterparse(chunks):
+    """Incrementally parse an iterable of byte strings, yielding
+    ``(event, element)`` pairs for ``start`` and ``end`` events as soon
+    as they are available. The input is cleaned up like in
+    bytes_to_elementtree().
+    """
+    if _lxml_etree is not None:
+        parser = _lxml_etree.XMLPullParser(
+                events=("start", "end"), huge_tree=False,
+                resolve_entities=False, no_network=True,
+                remove_comments=True, remove_pis=True)
+    else:
+        parser = ET.XMLPullParser(events=("start", "end"))
+    for chunk in _clean_chunks(chunks):
+        parser.feed(chunk)
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
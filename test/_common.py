@@ -1,6 +1,8 @@
 """Common support for the test cases."""
 from urllib.request import OpenerDirector
 
+import copy
+import functools
 import requests_mock
 import time
 import musicbrainzngs
@@ -42,8 +44,8 @@ class RequestsMockingTestCase(TestCase):
 
 # Mock timing.
 class Timecop(object):
-    """Mocks the timing system (namely time() and sleep()) for testing.
-    Inspired by the Ruby timecop library.
+    """Mocks the timing system (namely time(), monotonic() and sleep())
+    for testing. Inspired by the Ruby timecop library.
     """
     def __init__(self):
         self.now = time.time()
@@ -57,25 +59,34 @@ class Timecop(object):
     def install(self):
         self.orig = {
             'time': time.time,
+            'monotonic': time.monotonic,
             'sleep': time.sleep,
         }
         time.time = self.time
+        time.monotonic = self.time
         time.sleep = self.sleep
 
     def restore(self):
         time.time = self.orig['time']
+        time.monotonic = self.orig['monotonic']
         time.sleep = self.orig['sleep']
 
 
+@functools.lru_cache(maxsize=128)
+def _parse_test_data(path):
+    with open(path, 'rb') as msg:
+        return musicbrainzngs.mbxml.parse_message(msg)
+
+
 def open_and_parse_test_data(datadir, filename):
     """ Opens an XML file dumped from the MusicBrainz web service and returns
     the parses it.
 
+    Each file is only parsed once, every call returns a fresh copy.
+
     :datadir: The directory containing the file
     :filename: The filename of the XML file
     :returns: The parsed representation of the XML files content
 
     """
-    with open(join(datadir, filename), 'rb') as msg:
-        res = musicbrainzngs.mbxml.parse_message(msg)
-    return res
+    return copy.deepcopy(_parse_test_data(join(datadir, filename)))
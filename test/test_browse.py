@@ -29,6 +29,12 @@ class BrowseTest(_common.RequestsMockingTestCase):
         musicbrainzngs.browse_events(area=area, includes="aliases")
         self.assertEqual("https://musicbrainz.org/ws/2/event/?area=74e50e58-5deb-4b99-93a2-decbb365c07f&inc=aliases", self.last_url)
 
+    def test_browse_tuple_includes(self):
+        artist = "47f67b22-affe-4fe1-9d25-853d69bc0ee3"
+        musicbrainzngs.browse_releases(artist=artist, includes=("labels",),
+                                       release_status="official")
+        self.assertEqual("https://musicbrainz.org/ws/2/release/?artist=47f67b22-affe-4fe1-9d25-853d69bc0ee3&inc=labels&status=official", self.last_url)
+
     def test_browse_multiple_by(self):
         """It is an error to choose multiple entities to browse by"""
         self.assertRaises(Exception,
@@ -146,3 +152,11 @@ class BrowseTest(_common.RequestsMockingTestCase):
                     i in musicbrainzngs.VALID_INCLUDES[entity],
                     f"entity {entity}, {i} in BROWSE_INCLUDES but not VALID_INCLUDES",
                 )
+
+    def test_valid_includes_are_lists(self):
+        """The public include and search field tables keep their lists"""
+        for table in (musicbrainzngs.VALID_INCLUDES,
+                      musicbrainzngs.VALID_BROWSE_INCLUDES,
+                      musicbrainzngs.VALID_SEARCH_FIELDS):
+            for values in table.values():
+                self.assertIsInstance(values, list)
@@ -99,3 +99,29 @@ class CollectionTest(unittest.TestCase):
             self.assertTrue(False, "Expected an exception")
         except musicbrainzngs.AuthenticationError as e:
             self.assertEqual(e.cause.response.status_code, 401)
+
+    @requests_mock.Mocker()
+    def test_add_many_releases(self, m):
+        """ Adding more releases than fit into one URI takes
+        several requests"""
+        m.put(re.compile("ws/2/collection/"), text="<response/>")
+        musicbrainzngs.auth("user", "password")
+        releases = ["%036d" % i for i in range(450)]
+        musicbrainzngs.add_releases_to_collection(
+                "17905fdb-102d-40f0-91d3-eabcabc64fd3", releases)
+        self.assertEqual(2, len(m.request_history))
+        first, second = [r.url.split("?")[0].rsplit("/", 1)[1].split(";")
+                         for r in m.request_history]
+        self.assertEqual(releases, first + second)
+        self.assertEqual(400, len(first))
+
+    @requests_mock.Mocker()
+    def test_add_invalid_release(self, m):
+        """ Release ids are checked before any request is made """
+        m.put(re.compile("ws/2/collection/"), text="<response/>")
+        musicbrainzngs.auth("user", "password")
+        releases = ["%036d" % i for i in range(450)] + ["foo"]
+        with self.assertRaises(musicbrainzngs.UsageError):
+            musicbrainzngs.add_releases_to_collection(
+                    "17905fdb-102d-40f0-91d3-eabcabc64fd3", releases)
+        self.assertEqual(0, len(m.request_history))
@@ -152,3 +152,37 @@ class UrlTest(_common.RequestsMockingTestCase):
                 musicbrainzngs.get_instrument_by_id,
                 "dabdeb41-560f-4d84-aa6a-cf22349326fe", includes=["ratings"])
 
+    def testGetManyById(self):
+        ids = ["952a4205-023d-4235-897c-6fdb6f58dfaa",
+               "a16d1433-ba89-4f72-a47b-a370add0bb55"]
+        res = musicbrainzngs.get_many_by_id("artist", ids, includes="aliases")
+        self.assertEqual([{}, {}], res)
+        urls = sorted(r.url for r in self.m.request_history)
+        self.assertEqual([f"https://musicbrainz.org/ws/2/artist/{i}?inc=aliases"
+                          for i in sorted(ids)], urls)
+
+        self.assertRaises(musicbrainzngs.UsageError,
+                musicbrainzngs.get_many_by_id, "artist", ids, ["foo"])
+        self.assertRaises(musicbrainzngs.UsageError,
+                musicbrainzngs.get_many_by_id, "discid", ids)
+
+    def testUnhashableArguments(self):
+        artistid = "952a4205-023d-4235-897c-6fdb6f58dfaa"
+        self.assertRaises(musicbrainzngs.InvalidIncludeError,
+                musicbrainzngs.get_artist_by_id, artistid, [["aliases"]])
+        self.assertRaises(musicbrainzngs.InvalidIncludeError,
+                musicbrainzngs.get_artist_by_id, artistid, {"aliases"})
+        self.assertRaises(musicbrainzngs.InvalidFilterError,
+                musicbrainzngs.get_artist_by_id, artistid, ["releases"],
+                release_status=[["official"]])
+
+    def testTupleIncludes(self):
+        artistid = "952a4205-023d-4235-897c-6fdb6f58dfaa"
+        musicbrainzngs.get_artist_by_id(artistid, ("releases", "aliases"),
+                release_status="official")
+        self.assertEqual("https://musicbrainz.org/ws/2/artist/952a4205-023d-4235-897c-6fdb6f58dfaa?inc=releases+aliases&status=official", self.last_url)
+
+        res = musicbrainzngs.get_many_by_id("artist", [artistid],
+                includes=("releases",), release_status="official")
+        self.assertEqual([{}], res)
+        self.assertEqual("https://musicbrainz.org/ws/2/artist/952a4205-023d-4235-897c-6fdb6f58dfaa?inc=releases&status=official", self.last_url)
@@ -1,5 +1,10 @@
+import glob
+import os
 import unittest
-from musicbrainzngs import mbxml
+from musicbrainzngs import mbxml, util
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
 
 
 class MbXML(unittest.TestCase):
@@ -28,3 +33,32 @@ class MbXML(unittest.TestCase):
         self.assertEqual(2, len(parts))
         self.assertEqual("Invalid mbid.", parts[0])
         self.assertEqual(True, parts[1].startswith("For usage"))
+
+    def test_read_error_malformed(self):
+        self.assertIsNone(mbxml.get_error_message("<error><text>"))
+
+    def test_parse_malformed_response(self):
+        from musicbrainzngs import musicbrainz
+        self.assertRaises(musicbrainz.ResponseError,
+                          musicbrainz.mb_parser_xml, b"<metadata><artist>")
+
+    @unittest.skipIf(util._lxml is None, "lxml is not installed")
+    def test_lxml_matches_etree(self):
+        """ The test data parses the same with lxml and ElementTree """
+        for fn in sorted(glob.glob(os.path.join(DATA_DIR, "*", "*.xml"))):
+            with open(fn, "rb") as msg:
+                data = msg.read()
+            with_etree = (mbxml.parse_message(data),
+                          mbxml.parse_message([data]))
+            util.set_lxml(True)
+            try:
+                with_lxml = (mbxml.parse_message(data),
+                             mbxml.parse_message([data]))
+            finally:
+                util.set_lxml(False)
+            self.assertEqual(with_etree, with_lxml, fn)
+
+    @unittest.skipIf(util._lxml is not None, "lxml is installed")
+    def test_lxml_missing(self):
+        self.assertRaises(ImportError, util.set_lxml, True)
+        self.assertIsNone(util._lxml_etree)
@@ -4,12 +4,13 @@ import unittest
 import os
 from test import _common
 
+_HERE = os.path.dirname(__file__)
+
 
 class GetArtistTest(unittest.TestCase):
-    def setUp(self):
-        self.datadir = os.path.join(os.path.dirname(__file__), "data", "artist")
+    datadir = os.path.join(_HERE, "data", "artist")
 
-    def testArtistAliases(self):
+    def testArtistAliasesPresent(self):
         res = _common.open_and_parse_test_data(self.datadir, "0e43fe9d-c472-4b62-be9e-55f971a023e1_inc=aliases.xml")
         aliases = res["artist"]["alias-list"]
         self.assertEqual(len(aliases), 34)
@@ -24,6 +25,7 @@ class GetArtistTest(unittest.TestCase):
         self.assertEqual(a15["locale"], "en")
         self.assertEqual(a15["primary"], "primary")
 
+    def testArtistAliasesAbsent(self):
         res = _common.open_and_parse_test_data(self.datadir, "2736bad5-6280-4c8f-92c8-27a5e63bbab2_inc=aliases.xml")
         self.assertFalse("alias-list" in res["artist"])
     
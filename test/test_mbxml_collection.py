@@ -6,6 +6,8 @@ import musicbrainzngs
 from test import _common
 from re import compile
 
+_HERE = os.path.dirname(__file__)
+
 
 class UrlTest(_common.RequestsMockingTestCase):
     """ Test that the correct URL is generated when a query is made """
@@ -42,8 +44,7 @@ class UrlTest(_common.RequestsMockingTestCase):
 
 
 class GetCollectionTest(unittest.TestCase):
-    def setUp(self):
-        self.datadir = os.path.join(os.path.dirname(__file__), "data", "collection")
+    datadir = os.path.join(_HERE, "data", "collection")
 
     def testCollectionInfo(self):
         """
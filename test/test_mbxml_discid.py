@@ -7,6 +7,8 @@ import requests_mock
 from re import compile
 from test import _common
 
+_HERE = os.path.dirname(__file__)
+
 
 class UrlTest(unittest.TestCase):
     """ Test that the correct URL is generated when a search query is made """
@@ -38,8 +40,7 @@ class UrlTest(unittest.TestCase):
 
 
 class GetDiscIdTest(unittest.TestCase):
-    def setUp(self):
-        self.datadir = os.path.join(os.path.dirname(__file__), "data", "discid")
+    datadir = os.path.join(_HERE, "data", "discid")
 
     def testDiscId(self):
         """
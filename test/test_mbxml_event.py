@@ -4,11 +4,12 @@ import unittest
 import os
 from test import _common
 
+_HERE = os.path.dirname(__file__)
+
 
 class EventTest(unittest.TestCase):
 
-    def setUp(self):
-        self.datadir = os.path.join(os.path.dirname(__file__), "data", "event")
+    datadir = os.path.join(_HERE, "data", "event")
 
     def testCorrectId(self):
         event_id = "770fb0b4-0ad8-4774-9275-099b66627355"
@@ -5,10 +5,11 @@ import unittest
 import os
 from test import _common
 
+_HERE = os.path.dirname(__file__)
+
 
 class GetInstrumentTest(unittest.TestCase):
-    def setUp(self):
-        self.datadir = os.path.join(os.path.dirname(__file__), "data", "instrument")
+    datadir = os.path.join(_HERE, "data", "instrument")
 
     def testData(self):
         res = _common.open_and_parse_test_data(self.datadir, "9447c0af-5569-48f2-b4c5-241105d58c91.xml")
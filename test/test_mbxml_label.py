@@ -4,10 +4,11 @@ import unittest
 import os
 from test import _common
 
+_HERE = os.path.dirname(__file__)
+
 
 class GetLabelTest(unittest.TestCase):
-    def setUp(self):
-        self.datadir = os.path.join(os.path.dirname(__file__), "data", "label")
+    datadir = os.path.join(_HERE, "data", "label")
 
     def testLabelAliases(self):
         res = _common.open_and_parse_test_data(self.datadir, "022fe361-596c-43a0-8e22-bad712bb9548_inc=aliases.xml")
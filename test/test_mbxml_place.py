@@ -4,10 +4,11 @@ import unittest
 import os
 from test import _common
 
+_HERE = os.path.dirname(__file__)
+
 
 class PlaceTest(unittest.TestCase):
-    def setUp(self):
-        self.datadir = os.path.join(os.path.dirname(__file__), "data", "place")
+    datadir = os.path.join(_HERE, "data", "place")
 
     def testPlace(self):
         filename = "0c79cdbb-acd6-4e30-aaa3-a5c8d6b36a48_inc=aliases_tags.xml"
@@ -5,10 +5,11 @@ import unittest
 import os
 from test import _common
 
+_HERE = os.path.dirname(__file__)
+
 
 class GetRecordingTest(unittest.TestCase):
-    def setUp(self):
-        self.datadir = os.path.join(os.path.dirname(__file__), "data", "recording")
+    datadir = os.path.join(_HERE, "data", "recording")
 
     def testRecordingRelationCreditedAs(self):
         # some performance relations have a "credited-as" attribute
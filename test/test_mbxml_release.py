@@ -7,6 +7,8 @@ from test import _common
 import requests_mock
 from re import compile
 
+_HERE = os.path.dirname(__file__)
+
 
 class UrlTest(_common.RequestsMockingTestCase):
     """ Test that the correct URL is generated when a search query is made """
@@ -36,8 +38,7 @@ class UrlTest(_common.RequestsMockingTestCase):
 
 
 class GetReleaseTest(unittest.TestCase):
-    def setUp(self):
-        self.datadir = os.path.join(os.path.dirname(__file__), "data", "release")
+    datadir = os.path.join(_HERE, "data", "release")
 
     def testArtistCredit(self):
         """
@@ -74,7 +75,7 @@ class GetReleaseTest(unittest.TestCase):
         Test that if there is a track length, then `track_or_recording_length` has
         that, but if not then fill the value from the recording length
         """
-        fakedata = os.path.join(os.path.dirname(__file__), "data")
+        fakedata = os.path.join(_HERE, "data")
         res = _common.open_and_parse_test_data(fakedata, "fabricated-release.xml")
         tracks = res["release"]["medium-list"][0]["track-list"]
 
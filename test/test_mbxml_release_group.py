@@ -4,11 +4,11 @@ import unittest
 import os
 from test import _common
 
+_HERE = os.path.dirname(__file__)
+
 
 class GetReleaseGroupTest(unittest.TestCase):
-    def setUp(self):
-        self.datadir = os.path.join(os.path.dirname(__file__), "data",
-                "release-group")
+    datadir = os.path.join(_HERE, "data", "release-group")
 
     def testTypesExist(self):
         res = _common.open_and_parse_test_data(self.datadir,
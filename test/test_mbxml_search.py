@@ -74,6 +74,14 @@ class SearchArtistTest(unittest.TestCase):
         # so check for it here
         self.assertEqual("100", one["ext:score"])
 
+    def testStreamedMatchesBuffered(self):
+        fn = os.path.join(DATA_DIR, "search-artist.xml")
+        with open(fn, 'rb') as msg:
+            data = msg.read()
+        chunks = [data[i:i + 100] for i in range(0, len(data), 100)]
+        self.assertEqual(mbxml.parse_message(data),
+                         mbxml.parse_message(chunks))
+
 
 class SearchReleaseTest(unittest.TestCase):
     def testFields(self):
@@ -5,10 +5,11 @@ import unittest
 import os
 from test import _common
 
+_HERE = os.path.dirname(__file__)
+
 
 class GetWorkTest(unittest.TestCase):
-    def setUp(self):
-        self.datadir = os.path.join(os.path.dirname(__file__), "data", "work")
+    datadir = os.path.join(_HERE, "data", "work")
 
     def testWorkAliases(self):
         res = _common.open_and_parse_test_data(self.datadir, "80737426-8ef3-3a9c-a3a6-9507afb93e93_inc=aliases.xml")
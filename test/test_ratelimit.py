@@ -1,3 +1,4 @@
+import threading
 import unittest
 import time
 import musicbrainzngs
@@ -106,6 +107,52 @@ class BatchedRateLimitingTest(unittest.TestCase):
         time2 = time.time()
         self.assertTrue(time2 - time1 >= 1.0)
 
+class ThreadedRateLimitingTest(unittest.TestCase):
+    """ Calls from several threads are still started at the allowed rate,
+    but may run at the same time """
+    def setUp(self):
+        musicbrainzngs.set_rate_limit(2, 1)
+
+        self.cop = Timecop()
+        self.cop.install()
+
+        self.threads = 4
+        self.starts = []
+        self.overlapped = []
+        # Only passed once all calls are running at the same time
+        barrier = threading.Barrier(self.threads, timeout=5)
+
+        @musicbrainz._rate_limit
+        def limited():
+            self.starts.append(time.time())
+            try:
+                barrier.wait()
+                self.overlapped.append(True)
+            except threading.BrokenBarrierError:
+                self.overlapped.append(False)
+        self.func = limited
+
+    def tearDown(self):
+        musicbrainzngs.set_rate_limit(1, 1)
+
+        self.cop.restore()
+
+    def test_concurrent_queries_spaced(self):
+        spacing = musicbrainz.limit_interval / musicbrainz.limit_requests
+        time1 = time.time()
+        threads = [threading.Thread(target=self.func)
+                   for i in range(self.threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([True] * self.threads, self.overlapped)
+        for i, start in enumerate(sorted(self.starts)):
+            self.assertGreaterEqual(start - time1, i * spacing)
+        self.assertAlmostEqual((self.threads - 1) * spacing,
+                               time.time() - time1)
+
 class NoRateLimitingTest(unittest.TestCase):
     """ Disable rate limiting """
     def setUp(self):
@@ -1,8 +1,10 @@
 import musicbrainzngs
 from musicbrainzngs import musicbrainz
+import requests
 import requests_mock
 from re import compile
 from test import _common
+from unittest import mock
 
 
 class ArgumentTest(_common.RequestsMockingTestCase):
@@ -59,6 +61,13 @@ class ArgumentTest(_common.RequestsMockingTestCase):
         assert(self.m.request_history[-1]._request.hooks['response'][0].__name__ == "handle_401")
         assert(self.m.request_history[-1]._request.hooks['response'][1].__name__ == "handle_redirect")
 
+    def test_auth_handler_reused(self):
+        musicbrainz.auth("user", "password")
+        handler = musicbrainz._get_auth_handler()
+        self.assertIs(handler, musicbrainz._get_auth_handler())
+        musicbrainz.auth("other", "password")
+        self.assertEqual("other", musicbrainz._get_auth_handler().username)
+
     def test_auth_headers_ifset_no_user(self):
         musicbrainz._useragent = "test"
         musicbrainz.auth("", "")
@@ -66,6 +75,53 @@ class ArgumentTest(_common.RequestsMockingTestCase):
         req = musicbrainz._mb_request(path="foo", auth_required=musicbrainz.AUTH_IFSET)
         assert not self.m.request_history[-1]._request.hooks['response']
 
+    def test_session_reused(self):
+        musicbrainzngs.set_useragent("testapp", "0.1", "test@example.org")
+        old_session = musicbrainz._session
+        musicbrainz._session = None
+        try:
+            with mock.patch.object(musicbrainz.requests, "Session",
+                                   wraps=requests.Session) as session_class:
+                musicbrainz._mb_request(path="foo")
+                musicbrainz._mb_request(path="bar")
+        finally:
+            musicbrainz._session = old_session
+        self.assertEqual(1, session_class.call_count)
+        self.assertEqual(2, len(self.m.request_history))
+
+    def test_streamed_error_read(self):
+        musicbrainzngs.set_useragent("testapp", "0.1", "test@example.org")
+        self.m.get(compile("ws/2/.*"), status_code=503, text="<error/>")
+        with self.assertRaises(musicbrainzngs.ResponseError) as cm:
+            musicbrainz._mb_request(path="foo")
+        # The body was read and the connection released before raising
+        response = cm.exception.cause.response
+        self.assertTrue(response.raw.closed)
+        self.assertEqual(b"<error/>", response.content)
+
+    def test_streamed_body_cleaned(self):
+        """ Streamed responses get the same cleanup as buffered ones """
+        musicbrainzngs.set_useragent("testapp", "0.1", "test@example.org")
+        body = (b' \n<?xml version="1.0" encoding="UTF-8"?>'
+                b'<metadata xmlns="http://musicbrainz.org/ns/mmd-2.0#">'
+                b'<artist id="x"><name>A\x00\xffB</name></artist></metadata>')
+        self.m.get(compile("ws/2/.*"), content=body)
+        expected = {"artist": {"id": "x", "name": "AB"}}
+        self.assertEqual(expected, musicbrainz.mb_parser_xml(body))
+        self.assertEqual(expected, musicbrainz._mb_request(path="artist/x"))
+
+    def test_json_format(self):
+        musicbrainzngs.set_useragent("testapp", "0.1", "test@example.org")
+        self.m.get(compile("ws/2/.*"), text='{"id": "foo"}')
+        with self.assertWarns(UserWarning):
+            musicbrainzngs.set_format("json")
+        try:
+            res = musicbrainz._mb_request(path="foo")
+            self.assertIn("fmt=json", self.last_url)
+        finally:
+            musicbrainzngs.set_format("xml")
+        self.assertEqual({"id": "foo"}, res)
+
 
 class MethodTest(_common.RequestsMockingTestCase):
     """Tests the various _do_mb_* methods to ensure they're setting the
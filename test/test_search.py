@@ -32,6 +32,10 @@ class SearchUrlTest(_common.RequestsMockingTestCase):
         with self.assertRaises(musicbrainzngs.InvalidSearchFieldError):
             musicbrainzngs.search_annotations(foo="value")
 
+    def test_search_unicode(self):
+        musicbrainzngs.search_artists("Sigur Rós")
+        self.assertEqual("https://musicbrainz.org/ws/2/artist/?query=Sigur+R%C3%B3s", self.last_url)
+
     def test_search_artists(self):
         musicbrainzngs.search_artists("Dynamo Go")
         self.assertEqual("https://musicbrainz.org/ws/2/artist/?query=Dynamo+Go", self.last_url)
@@ -36,3 +36,24 @@ class SubmitTest(_common.RequestsMockingTestCase):
 
         musicbrainz.submit_tags(artist_tags={"mbid": "single"})
         musicbrainz.mbxml.make_tag_request = oldmake_tag_request
+
+    def test_submit_tags_keeps_input(self):
+        oldmake_tag_request = musicbrainz.mbxml.make_tag_request
+        musicbrainz.mbxml.make_tag_request = lambda **kwargs: ""
+
+        tags = {"mbid": "single"}
+        musicbrainz.submit_tags(artist_tags=tags)
+        musicbrainz.mbxml.make_tag_request = oldmake_tag_request
+        self.assertEqual({"mbid": "single"}, tags)
+
+    def test_submit_isrcs(self):
+        def make_xml(rec2isrcs):
+            self.assertEqual({"mbid1": ["isrc1"], "mbid2": ("isrc2", "isrc3")},
+                             rec2isrcs)
+            return ""
+        oldmake_isrc_request = musicbrainz.mbxml.make_isrc_request
+        musicbrainz.mbxml.make_isrc_request = make_xml
+
+        musicbrainz.submit_isrcs({"mbid1": "isrc1",
+                                  "mbid2": ("isrc2", "isrc3")})
+        musicbrainz.mbxml.make_isrc_request = oldmake_isrc_request
@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 
+import concurrent.futures
 import pathlib
+import threading
+import time
 
 import requests
-import time
 
 BASEDIR = 'test/data'
 BASEURL = 'https://musicbrainz.org/ws/2'
+# MusicBrainz allows one request per second, keep some margin
+INTERVAL = 1.5
+# characters in the url that can't be used in file names
+FILENAME_TABLE = str.maketrans({'?': '_', '+': '_', '/': '_'})
 
 XMLDATALIST = {
     'artist': [
@@ -71,17 +77,48 @@ XMLDATALIST = {
     ]
 }
 
-with requests.Session() as session:
+
+class RateLimiter:
+    """Hand out request slots at most one per INTERVAL, across threads."""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        time.sleep(slot - now)
+
+
+def fetch(session, limiter, url, filepath):
+    limiter.wait()
+    print(f'Fetching {url}')
+    with session.get(url, stream=True) as response:
+        # Don't replace a fixture with an error page
+        response.raise_for_status()
+        print(f'Writing {str(filepath)}')
+        with open(filepath, 'wb') as fhout:
+            for chunk in response.iter_content(chunk_size=65536):
+                fhout.write(chunk)
+
+
+limiter = RateLimiter(INTERVAL)
+with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor, \
+        requests.Session() as session:
+    session.headers['User-Agent'] = 'python-musicbrainzngs-testdata'
+    futures = []
     for topic, identifiers in XMLDATALIST.items():
+        filedir = pathlib.Path(BASEDIR).joinpath(topic)
+        filedir.mkdir(exist_ok=True, parents=True)
         for obj in identifiers:
             url = f'{BASEURL}/{topic}/{obj}'
-            filename = obj.replace('?', '_').replace('+', '_').replace('/', '_')
-            filedir = pathlib.Path(BASEDIR).joinpath(topic)
-            filedir.mkdir(exist_ok=True, parents=True)
+            filename = obj.translate(FILENAME_TABLE)
             filepath = filedir.joinpath(filename).with_suffix('.xml')
-            print(f'Fetching {url}')
-            response = session.get(url)
-            print(f'Writing {str(filepath)}')
-            with open(filepath, 'wb') as fhout:
-                fhout.write(response.content)
-            time.sleep(2)
+            futures.append(
+                executor.submit(fetch, session, limiter, url, filepath))
+    for future in concurrent.futures.as_completed(futures):
+        future.result()